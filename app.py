@@ -1,5 +1,4 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from data_loader import load_reference_data, preview_data
 from plotter import plot_graphs
 from io import BytesIO
@@ -372,7 +371,7 @@ if st.button("📊 Generate Plot", type="primary", use_container_width=True):
             x_label = "Pressure (psi)"
             y_label = "Depth (ft)"
             figsize = (12, 8) if plot_grouping == "One per Curve" else (14, 10)
-            dpi = 300
+            dpi = 300  # Each plot is rendered once to PNG and reused for display and downloads
             
             # Call plot_graphs with correct parameter order
             figs, skipped_curves = plot_graphs(
@@ -407,7 +406,8 @@ if st.button("📊 Generate Plot", type="primary", use_container_width=True):
                 debug=debug,
                 invert_y_axis=invert_y_axis,
                 figsize=figsize,
-                dpi=dpi
+                dpi=dpi,
+                output="png"
             )
             
             # Display plots
@@ -424,38 +424,29 @@ if st.button("📊 Generate Plot", type="primary", use_container_width=True):
                 </div>
                 """, unsafe_allow_html=True)
                 
-                for i, (fig, curve_name) in enumerate(figs):
+                for i, (png, curve_name) in enumerate(figs):
                     st.subheader(f"Plot {i+1}" + (f": {curve_name}" if plot_grouping == "One per Curve" else ""))
                     
                     # Display plot
-                    st.pyplot(fig)
+                    st.image(png, use_container_width=True)
                     
                     # Download button for individual plots
-                    buf = BytesIO()
-                    fig.savefig(buf, format='png', bbox_inches='tight', dpi=dpi)
-                    buf.seek(0)
-                    img_str = base64.b64encode(buf.read()).decode()
+                    img_str = base64.b64encode(png).decode()
                     safe_name = curve_name.replace(' ', '_').replace('/', '_')[:50]  # Sanitize filename
                     st.markdown(f"""
                     <a href="data:image/png;base64,{img_str}" download="curve_plot_{i+1}_{safe_name}.png" style="text-decoration: none; padding: 0.5rem; background-color: #007bff; color: white; border-radius: 0.25rem; display: inline-block;">
                         💾 Download Plot {i+1}: {curve_name}
                     </a>
                     """, unsafe_allow_html=True)
-                    
-                    # Close the figure to free memory
-                    plt.close(fig)
                 
                 # Bulk download option
                 if len(figs) > 1:
                     st.markdown("### 📦 Bulk Download")
                     zip_buffer = BytesIO()
                     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for i, (fig, curve_name) in enumerate(figs):
-                            buf = BytesIO()
-                            fig.savefig(buf, format='png', bbox_inches='tight', dpi=dpi)
-                            buf.seek(0)
+                        for i, (png, curve_name) in enumerate(figs):
                             safe_name = f"curve_plot_{i+1}_{curve_name.replace(' ', '_').replace('/', '_')[:50]}.png"
-                            zip_file.writestr(safe_name, buf.getvalue())
+                            zip_file.writestr(safe_name, png)
                     
                     zip_buffer.seek(0)
                     zip_str = base64.b64encode(zip_buffer.read()).decode()
@@ -483,8 +474,6 @@ if st.button("📊 Generate Plot", type="primary", use_container_width=True):
                 <small>Please check your data format and try again.</small>
             </div>
             """, unsafe_allow_html=True)
-            # Clean up any open figures on error
-            plt.close('all')
 
 # Footer
 st.markdown("---")
@@ -102,7 +102,8 @@ def process_row(row, index, data_ref, skipped_rows, max_degree, debug=False):
                     print(f"Row {index} ({name}): Invalid coefficient in column {col_idx + 2}, using 0.0")
     
     # Check for all-zero coefficients
-    if all(abs(c) < 1e-12 for c in coefficients):  # Using small epsilon for floating point comparison
+    abs_coeffs = np.abs(np.asarray(coefficients, dtype=np.float64))
+    if np.all(abs_coeffs < 1e-12):  # Using small epsilon for floating point comparison
         skipped_rows.append(f"Row {index} ({name}): All coefficients are effectively zero")
         return
     
@@ -111,10 +112,11 @@ def process_row(row, index, data_ref, skipped_rows, max_degree, debug=False):
     if degree > max_degree:
         skipped_rows.append(f"Row {index} ({name}): Degree {degree} exceeds maximum allowed ({max_degree}). Truncated.")
         coefficients = coefficients[:max_degree + 1]  # Keep up to degree 10
+        abs_coeffs = abs_coeffs[:max_degree + 1]
     
     # Check for extreme coefficient values (for large ranges like -10000 to 10000)
-    extreme_coeffs = [c for c in coefficients if abs(c) > 1e12]
-    if extreme_coeffs and debug:
+    if debug and (abs_coeffs > 1e12).any():
+        extreme_coeffs = [c for c, a in zip(coefficients, abs_coeffs) if a > 1e12]
         print(f"Row {index} ({name}): Warning - extreme coefficients detected: {extreme_coeffs}")
     
     # Check if leading coefficients are zero (can cause numerical issues)
@@ -1,5 +1,17 @@
+import atexit
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from types import MappingProxyType
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from adjustText import adjust_text
 
 DEFAULT_COLORS = [
@@ -9,41 +21,52 @@ DEFAULT_COLORS = [
     '#843c39', '#de9ed6', '#7b4f4b', '#a55194', '#ce1256'
 ]
 
-def plot_graphs(data_ref, use_colorful, num_colors, bg_color, legend_loc, custom_legends, show_grid, 
-                grid_major_x, grid_minor_x, grid_major_y, grid_minor_y, x_min, x_max, y_min, y_max, 
-                x_pos, y_pos, x_major_int, x_minor_int, y_major_int, y_minor_int, 
-                title, x_label, y_label, plot_grouping, auto_scale_y, stop_y_exit, stop_x_exit, debug=False,
-                invert_y_axis=False, figsize=(10, 6), dpi=300):
-    """
-    Plot polynomial curves with improved handling for large ranges and degree limits.
+# Map user-friendly legend_loc to Matplotlib loc
+_LOC_MAP = {
+    "Upper Right": "upper right",
+    "Upper Left": "upper left",
+    "Lower Right": "lower right",
+    "Lower Left": "lower left",
+    "Center Left": "center left",
+    "Center Right": "center right",
+    "Upper Center": "upper center",
+    "Lower Center": "lower center",
+    "Best": "best"
+}
+
+# Legend bbox_to_anchor per Matplotlib loc; 'best' lets Matplotlib choose
+_BBOX_BY_LOC = {
+    "upper right": (1.05, 0.5),
+    "upper left": (-0.05, 0.5),
+    "lower right": (1.05, 0.5),
+    "lower left": (-0.05, 0.5),
+    "center left": (-0.05, 0.5),
+    "center right": (1.05, 0.5),
+    "upper center": (0.5, 1.05),
+    "lower center": (0.5, -0.05),
+    "best": None
+}
+
+@functools.lru_cache(maxsize=64)
+def _palette(use_colorful, num_colors):
+    """Return the first num_colors default colors as a shared tuple, or just black."""
+    return tuple(DEFAULT_COLORS[:min(num_colors, len(DEFAULT_COLORS))]) if use_colorful else ('black',)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_custom_legends(custom_legends, use_colorful):
     """
-    figs = []
-    colors = DEFAULT_COLORS[:min(num_colors, len(DEFAULT_COLORS))] if use_colorful else ['black']
-    skipped_curves = []
+    Parse "name: color" / "name" lines into label and color maps.
     
-    # Input validation
-    if x_min > x_max:
-        raise ValueError(f"x_min ({x_min}) must be <= x_max ({x_max})")
-    if not data_ref:
-        return figs, ["No data provided for plotting"]
+    Cached because interactive reruns pass the same text every time; the
+    maps are shared between calls, so they are returned read-only.
     
-    # Map user-friendly legend_loc to Matplotlib loc
-    loc_map = {
-        "Upper Right": "upper right",
-        "Upper Left": "upper left",
-        "Lower Right": "lower right",
-        "Lower Left": "lower left",
-        "Center Left": "center left",
-        "Center Right": "center right",
-        "Upper Center": "upper center",
-        "Lower Center": "lower center",
-        "Best": "best"
-    }
-    matplotlib_loc = loc_map.get(legend_loc, "best")
-
-    # Parse custom legends
+    Returns:
+        Tuple (custom_label_map, custom_color_map, error_messages)
+    """
     custom_label_map = {}
     custom_color_map = {}
+    errors = []
     if custom_legends:
         for line in custom_legends.split('\n'):
             line = line.strip()
@@ -56,10 +79,532 @@ def plot_graphs(data_ref, use_colorful, num_colors, bg_color, legend_loc, custom
                     custom_label_map[name] = name
                     custom_color_map[name] = color.strip() if use_colorful else 'black'
                 except ValueError:
-                    skipped_curves.append(f"Invalid custom legend format: {line}")
+                    errors.append(f"Invalid custom legend format: {line}")
             else:
                 name = line.strip()
                 custom_label_map[name] = name
+    return (MappingProxyType(custom_label_map), MappingProxyType(custom_color_map),
+            tuple(errors))
+
+
+def _horner(coeffs, x):
+    """
+    Evaluate a polynomial (highest degree first) at x with Horner's scheme.
+    
+    Works in place on a single output array, so no temporaries are allocated
+    per degree as np.polyval and numpy.polynomial.polyval do. The first step is
+    peeled so the output starts as coeffs[0] * x rather than a filled array.
+    """
+    if len(coeffs) <= 1:
+        return np.full_like(x, coeffs[0] if len(coeffs) else 0.0)
+    out = x * coeffs[0]
+    out += coeffs[1]
+    for c in coeffs[2:]:
+        out *= x
+        out += c
+    return out
+
+
+# Below this many curves each one is evaluated on its own in the plotting pass
+_BATCHED_EVAL_MIN_CURVES = 8
+
+# From this many curves one matrix product beats Horner across the curve axis
+_GEMM_EVAL_MIN_CURVES = 32
+
+
+def _strip_leading_zeros(coeffs):
+    """
+    Drop zero high-order coefficients so Horner runs only over the real degree.
+    
+    A leading zero contributes 0 * x + c = c exactly, so the values are unchanged.
+    An all-zero polynomial keeps its constant term.
+    """
+    if len(coeffs) <= 2 or coeffs[0] != 0:
+        return coeffs
+    nonzero = np.flatnonzero(coeffs)
+    return coeffs[nonzero[0]:] if nonzero.size else coeffs[-1:]
+
+
+def _entry_coefficients(entry):
+    """Return an entry's coefficients as a float64 array, or None if unusable."""
+    try:
+        return np.asarray(entry['coefficients'], dtype=np.float64)
+    except (KeyError, ValueError, TypeError):
+        return None  # Reported by the serial plotting pass
+
+
+def _horner_rows(coeff_matrix, x):
+    """
+    Evaluate every row of a right-aligned (N, degree + 1) coefficient matrix on x.
+    
+    The Horner recurrence runs on the whole (N, len(x)) output at once, so the
+    NumPy call count depends on the degree only. Zero padding on the left adds
+    exact zeros, so each row matches _horner on its own coefficients.
+    """
+    width = coeff_matrix.shape[1]
+    if width == 0:
+        # Empty coefficient lists evaluate to 0, as in _horner
+        return np.zeros((coeff_matrix.shape[0], len(x)))
+    if width == 1:
+        return np.repeat(coeff_matrix, len(x), axis=1)
+    out = np.multiply.outer(coeff_matrix[:, 0], x)
+    out += coeff_matrix[:, 1:2]
+    for k in range(2, width):
+        out *= x
+        out += coeff_matrix[:, k:k + 1]
+    return out
+
+
+def _evaluate_curves_batched(entries, p1_full):
+    """
+    Evaluate many polynomials on p1_full in one batch.
+    
+    Coefficients are right-aligned in a zero-padded (N, degree + 1) matrix. From
+    _GEMM_EVAL_MIN_CURVES rows it is multiplied by the Vandermonde matrix of
+    p1_full, so one BLAS GEMM replaces N Horner loops; below that, or if the
+    powers of p1_full overflow (the zero padding would then turn every curve
+    to NaN), it is evaluated with _horner_rows.
+    
+    Returns:
+        Dict mapping id(entry) to (coeffs, y_vals, finite)
+    """
+    keys = []
+    parsed = []
+    coeff_rows = []
+    for entry in entries:
+        coeffs = _entry_coefficients(entry)
+        if coeffs is not None:
+            keys.append(id(entry))
+            parsed.append(coeffs)
+            coeff_rows.append(_strip_leading_zeros(coeffs[:11]))
+    if not keys:
+        return {}
+    
+    width = max(len(coeffs) for coeffs in coeff_rows)
+    coeff_matrix = np.zeros((len(keys), width))
+    for row, coeffs in zip(coeff_matrix, coeff_rows):
+        row[width - len(coeffs):] = coeffs
+    
+    y_matrix = None
+    if len(keys) >= _GEMM_EVAL_MIN_CURVES:
+        with np.errstate(over='ignore'):
+            vander = np.vander(p1_full, width)
+        if np.isfinite(vander).all():
+            y_matrix = coeff_matrix @ vander.T
+    if y_matrix is None:
+        y_matrix = _horner_rows(coeff_matrix, p1_full)
+    finite = np.isfinite(y_matrix)
+    return {key: (parsed[i], y_matrix[i], finite[i]) for i, key in enumerate(keys)}
+
+
+def _compute_curve(entry, p1_full, y_min, y_max, auto_scale_y, stop_y_exit, cache=None):
+    """
+    Evaluate a curve on p1_full and apply the range and exit rules, without any plotting.
+    
+    cache maps id(entry) to (coeffs, y_vals, finite) and is filled on a miss, so a
+    curve parsed and evaluated for auto-scaling is not redone when it is plotted.
+    It is per call: the entry itself is never written to, so edited coefficients
+    are picked up by the next call.
+    
+    Returns:
+        Tuple (p_plot, y_plot, messages); p_plot and y_plot are None if the
+        curve was skipped. messages are the skip/truncation notes for the curve.
+    """
+    messages = []
+    name = entry['name']
+    cached = cache.get(id(entry)) if cache is not None else None
+    if cached is None:
+        try:
+            coeffs = np.asarray(entry['coefficients'], dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            messages.append(f"Curve {name}: Invalid coefficients ({str(e)})")
+            return None, None, messages
+        # Evaluate polynomial up to degree 10; overflow surfaces as NaN/Inf and is filtered below
+        y_vals = _horner(_strip_leading_zeros(coeffs[:11]), p1_full)
+        cached = (coeffs, y_vals, np.isfinite(y_vals))
+        if cache is not None:
+            cache[id(entry)] = cached
+    coeffs, y_vals, finite = cached
+
+    # Check polynomial degree limit
+    degree = len(coeffs) - 1
+    if degree > 10:
+        messages.append(f"Curve {name}: Degree {degree} exceeds maximum allowed (10). Truncated to degree 10.")
+
+    # Reuse the cached finite mask rather than scanning y_vals again for NaN and Inf
+    if not finite.any():
+        messages.append(f"Curve {name}: No valid polynomial output (all NaN/Inf)")
+        return None, None, messages
+
+    # p1_full spans exactly [x_min, x_max], so only the y values can invalidate a point.
+    # NaN and +/-Inf fail one of the y comparisons, so the y mask needs no finite term;
+    # without y limits the cached mask is used as is (it is only cut when y-limited).
+    y_limited = not auto_scale_y and y_min is not None and y_max is not None
+    if y_limited:
+        valid = y_vals >= y_min
+        valid &= y_vals <= y_max
+    else:
+        valid = finite
+
+    # Handle stop_y_exit - only truncate after first exit, not before
+    if stop_y_exit and y_limited and len(valid) > 1:
+        # An exit is an in-range point followed by an out-of-range one, so the
+        # curve has always entered the range before its first exit
+        exits = ~valid[1:]
+        exits &= valid[:-1]
+        # argmax stops at the first True; it returns 0 when there is none, hence the
+        # check (and it needs a non-empty exits, hence the length guard above)
+        first_exit_idx = int(np.argmax(exits)) + 1
+        if exits[first_exit_idx - 1]:
+            valid[first_exit_idx:] = False
+            messages.append(f"Curve {name}: Truncated at x={p1_full[first_exit_idx]:.2f}, y={y_vals[first_exit_idx]:.2f}")
+
+    # Materialize the plotted points once, after every truncation has been applied
+    p_plot = p1_full[valid]
+    y_plot = y_vals[valid]
+
+    if len(p_plot) < 2:
+        messages.append(f"Curve {name}: Insufficient valid points ({len(p_plot)})")
+        return None, None, messages
+    return p_plot, y_plot, messages
+
+
+# Figures returned through release_figures() are kept here and reused by later plot_graphs calls.
+# Streamlit runs each session on its own thread, so the pool is only touched under the lock.
+_FIG_POOL = []
+_FIG_POOL_MAX = 16
+_FIG_POOL_LOCK = threading.Lock()
+# Drop the leftovers at interpreter exit rather than leaving them to module teardown
+atexit.register(_FIG_POOL.clear)
+
+
+def _acquire_figure(figsize, dpi):
+    """
+    Return a (fig, ax) pair, reusing a pooled figure when one is available.
+    
+    New figures are built directly on an Agg canvas rather than through pyplot,
+    so they skip pyplot's figure manager and are freed once unreferenced.
+    """
+    with _FIG_POOL_LOCK:
+        fig = _FIG_POOL.pop() if _FIG_POOL else None
+    if fig is not None:
+        fig.set_size_inches(figsize)
+        fig.set_dpi(dpi)
+    else:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _release_figure(fig):
+    """
+    Put a figure back into the pool; beyond the pool size it is simply dropped.
+    
+    The figure is emptied and given a fresh canvas first, so the pool holds no
+    curve data and no Agg renderer (a full RGBA buffer, 30 MB at 14x10 in and
+    300 dpi) between calls.
+    """
+    fig.clear()
+    FigureCanvasAgg(fig)
+    with _FIG_POOL_LOCK:
+        if len(_FIG_POOL) < _FIG_POOL_MAX and fig not in _FIG_POOL:
+            _FIG_POOL.append(fig)
+
+
+def release_figures(figs):
+    """
+    Hand figures returned by plot_graphs back for reuse.
+    
+    Only needed with output="figure": PNG output returns its figures to the
+    pool itself. Call it once the figures have been shown or saved; they must
+    not be used afterwards.
+    
+    Args:
+        figs: List of (Figure, name) tuples as returned by plot_graphs
+    """
+    for fig, _ in figs:
+        _release_figure(fig)
+
+
+def _figure_to_png(fig, dpi):
+    """Render a figure to PNG bytes."""
+    buf = BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=dpi)
+    return buf.getvalue()
+
+
+def _apply_locators(ax, intervals):
+    """
+    Set tick locators on an axes from precomputed (major_x, minor_x, major_y, minor_y) intervals.
+    
+    A fresh MultipleLocator is made per axes: a locator computes ticks from the
+    last axis it was attached to, so sharing one across figures with different
+    limits would place ticks for the wrong range.
+    """
+    major_x, minor_x, major_y, minor_y = intervals
+    if major_x:
+        ax.xaxis.set_major_locator(plt.MultipleLocator(major_x))
+    if minor_x:
+        ax.xaxis.set_minor_locator(plt.MultipleLocator(minor_x))
+    if major_y:
+        ax.yaxis.set_major_locator(plt.MultipleLocator(major_y))
+    if minor_y:
+        ax.yaxis.set_minor_locator(plt.MultipleLocator(minor_y))
+
+
+def _space_labels_y(texts, ax):
+    """
+    Spread end-of-curve labels apart vertically, keeping them inside the axes.
+    
+    Labels are sorted by y and each one is pushed up until it sits at least one
+    label height above the previous one; if that runs the stack past the top of
+    the axes, a second, top-down pass pushes it back down. The height is taken
+    from the font size (plus the rounded box padding) and converted to data
+    units with ax.transData, so the axes limits must already be final.
+    """
+    if len(texts) < 2:
+        return
+    height_px = 1.8 * max(t.get_fontsize() for t in texts) * ax.figure.dpi / 72
+    (_, y0), (_, y1) = ax.transData.inverted().transform([(0, 0), (0, height_px)])
+    min_gap = abs(y1 - y0)
+    # get_ylim is reversed on an inverted axis; labels are centered on their y
+    y_low, y_high = sorted(ax.get_ylim())
+    y_low += min_gap / 2
+    y_high -= min_gap / 2
+    
+    texts = sorted(texts, key=lambda t: t.get_position()[1])
+    ys = [min(max(t.get_position()[1], y_low), y_high) for t in texts]
+    for i in range(1, len(ys)):
+        ys[i] = max(ys[i], ys[i - 1] + min_gap)
+    if ys[-1] > y_high:
+        ys[-1] = y_high
+        for i in range(len(ys) - 2, -1, -1):
+            ys[i] = min(ys[i], ys[i + 1] - min_gap)
+    # More labels than fit: the lowest ones overlap at the bottom rather than leave the axes
+    for text, y in zip(texts, ys):
+        y = max(y, y_low)
+        if y != text.get_position()[1]:
+            text.set_y(y)
+
+
+def _position_axes(ax, x_pos, y_pos, centered):
+    """
+    Place spines, ticks and axis labels on a fresh axes.
+    
+    centered moves the left and bottom spines through (0, 0) and hides the
+    other two. Bottom/left placement on an uncentered axes is matplotlib's
+    default, so nothing is touched in that case.
+    """
+    if centered:
+        for side in ('left', 'bottom'):
+            ax.spines[side].set_position('zero')
+        for side in ('right', 'top'):
+            ax.spines[side].set_color('none')
+    elif x_pos == 'bottom' and y_pos == 'left':
+        return
+    ax.xaxis.set_label_position(x_pos)
+    ax.xaxis.set_ticks_position(x_pos)
+    ax.yaxis.set_label_position(y_pos)
+    ax.yaxis.set_ticks_position(y_pos)
+
+
+def _configure_axes(ax, x_min, x_max, y_min, y_max, invert_y_axis, centered, x_pos, y_pos,
+                    x_label, y_label, show_grid, show_minor_grid, use_colorful, locator_intervals):
+    """
+    Apply the axis labels, limits, spine placement, grid and ticks shared by every plot.
+    
+    Everything here is the same for all figures of a plot_graphs call except the
+    y limits and whether the spines are centered.
+    """
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_xlim(x_min, x_max)
+    if y_min is not None and y_max is not None:
+        ax.set_ylim(y_min, y_max)
+    if invert_y_axis:
+        ax.invert_yaxis()
+
+    # Center spines at (0,0) if ranges include negative and positive values
+    _position_axes(ax, x_pos, y_pos, centered)
+
+    if show_grid:
+        grid_color = '#D3D3D3' if use_colorful else 'black'
+        ax.grid(True, which='major', color=grid_color, alpha=0.5 if use_colorful else 0.3)
+        if show_minor_grid:
+            ax.grid(True, which='minor', color=grid_color, linestyle='--', alpha=0.5 if use_colorful else 0.2)
+
+    _apply_locators(ax, locator_intervals)
+
+
+def _plot_single_curve(ax, entry, color, label, p1_full, y_min, y_max, auto_scale_y, stop_y_exit,
+                       use_colorful, bg_color, rasterize_curves, skipped_curves, cache=None):
+    """
+    Plot one curve on ax, appending any skip or truncation notes to skipped_curves.
+    Returns the plotted Line2D, or False if the curve was skipped.
+    """
+    name = entry['name']
+    # _compute_curve fills the cache with the parsed coefficients read below
+    if cache is None:
+        cache = {}
+    p_plot, y_plot, messages = _compute_curve(entry, p1_full, y_min, y_max, auto_scale_y, stop_y_exit,
+                                              cache=cache)
+    skipped_curves.extend(messages)
+    if p_plot is None:
+        return False
+
+    # A straight line needs only its end points; its valid samples are always one
+    # contiguous run, since a line crosses each y bound at most once
+    if len(_strip_leading_zeros(cache[id(entry)][0][:11])) <= 2:
+        p_plot, y_plot = p_plot[[0, -1]], y_plot[[0, -1]]
+
+    # Plot the curve
+    try:
+        line, = ax.plot(p_plot, y_plot, color=color, linewidth=2.5, label=label if use_colorful else None,
+                        rasterized=rasterize_curves)
+    except Exception as e:
+        skipped_curves.append(f"Curve {name}: Plotting failed ({str(e)})")
+        return False
+
+    # Add label for non-colorful mode
+    if not use_colorful and len(p_plot) > 0:
+        y_range = (y_max - y_min) if not auto_scale_y and y_min is not None and y_max is not None else (max(y_plot) - min(y_plot))
+        end_x, end_y = p_plot[-1], y_plot[-1] - 0.05 * y_range if y_range > 0 else y_plot[-1]
+
+        # Avoid label overlap by adjusting position
+        ax.text(end_x, end_y, label, fontsize=8, ha='left', va='center',
+                bbox=dict(boxstyle="round,pad=0.3", facecolor=bg_color, alpha=0.8))
+
+    return line
+
+
+# Below this many curves the process pool round-trips cost more than they save
+_PARALLEL_MIN_CURVES = 4
+
+# Worker processes are started once and kept for the life of the process; sessions
+# share the pool, so it is only created or dropped under the lock
+_render_executor = None
+_RENDER_EXECUTOR_LOCK = threading.Lock()
+
+
+def _init_render_worker():
+    """Process pool initializer: workers only ever render off-screen."""
+    plt.switch_backend('Agg')
+
+
+def _get_render_executor():
+    """
+    Return the shared render pool, starting it on first use.
+    
+    Workers are spawned rather than forked: the Streamlit server is
+    multi-threaded, and forking it can deadlock on locks held by other threads.
+    Spawning is slow (each worker re-imports matplotlib), hence the reuse.
+    """
+    global _render_executor
+    with _RENDER_EXECUTOR_LOCK:
+        if _render_executor is None:
+            _render_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                   mp_context=multiprocessing.get_context("spawn"),
+                                                   initializer=_init_render_worker)
+        return _render_executor
+
+
+def _discard_render_executor(executor):
+    """Shut down a failed render pool so the next call starts a fresh one."""
+    global _render_executor
+    with _RENDER_EXECUTOR_LOCK:
+        # Another session may already have replaced it
+        if _render_executor is executor:
+            _render_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_curve_png(call_args):
+    """Process pool task: render a single-curve plot_graphs call to PNG."""
+    return plot_graphs(**call_args)
+
+
+def _render_curves_parallel(data_ref, call_args):
+    """
+    Render one PNG per curve in worker processes.
+    
+    Returns:
+        Tuple (figs, skipped_curves) in data_ref order, or None if the process
+        pool is unavailable and the caller should render serially instead
+    """
+    jobs = [dict(call_args, data_ref=[entry], debug=False, color_offset=call_args['color_offset'] + i)
+            for i, entry in enumerate(data_ref) if 'name' in entry and 'coefficients' in entry]
+    executor = _get_render_executor()
+    try:
+        results = iter(list(executor.map(_render_curve_png, jobs)))
+    except (OSError, BrokenProcessPool, RuntimeError):
+        # RuntimeError also covers a pool another session shut down mid-call; an
+        # error raised by the plot itself resurfaces in the serial fallback
+        _discard_render_executor(executor)
+        return None
+    
+    figs = []
+    skipped_curves = []
+    for i, entry in enumerate(data_ref):
+        if 'name' not in entry or 'coefficients' not in entry:
+            skipped_curves.append(f"Entry {i}: Missing 'name' or 'coefficients' key")
+            continue
+        entry_figs, entry_skipped = next(results)
+        figs.extend(entry_figs)
+        skipped_curves.extend(entry_skipped)
+    return figs, skipped_curves
+
+
+def plot_graphs(data_ref, use_colorful, num_colors, bg_color, legend_loc, custom_legends, show_grid, 
+                grid_major_x, grid_minor_x, grid_major_y, grid_minor_y, x_min, x_max, y_min, y_max, 
+                x_pos, y_pos, x_major_int, x_minor_int, y_major_int, y_minor_int, 
+                title, x_label, y_label, plot_grouping, auto_scale_y, stop_y_exit, stop_x_exit, debug=False,
+                invert_y_axis=False, figsize=(10, 6), dpi=100, output="figure", adjust_labels=False,
+                rasterize_curves=False, color_offset=0):
+    """
+    Plot polynomial curves with improved handling for large ranges and degree limits.
+    
+    Returns (figs, skipped_curves). figs holds (Figure, name) tuples, or
+    (png_bytes, name) tuples when output="png"; in that mode "One per Curve"
+    plots of several curves are rendered in parallel worker processes.
+    
+    In black-and-white mode the curve labels are spread apart with a single
+    vertical pass; adjust_labels=True uses adjustText instead, which also moves
+    labels sideways and handles crowded plots better but is much slower.
+    
+    With rasterize_curves=True the curve lines are drawn as images when a
+    figure is saved to a vector format (PDF, SVG) while axes and text stay
+    vector; it has no effect on PNG output.
+    
+    stop_x_exit is accepted for compatibility but has no effect: curves are
+    sampled on [x_min, x_max] only, so they never leave the x range.
+    
+    Curves take palette colors in order, starting at index color_offset, so a
+    caller plotting part of a larger list can keep each curve's color.
+    
+    dpi defaults to 100, screen resolution; it used to default to 300. Pass
+    dpi=300 for print-quality output, as the app does.
+    """
+    call_args = dict(locals())
+    figs = []
+    colors = _palette(use_colorful, num_colors)
+    skipped_curves = []
+    
+    # Input validation
+    if x_min > x_max:
+        raise ValueError(f"x_min ({x_min}) must be <= x_max ({x_max})")
+    if output not in ("figure", "png"):
+        raise ValueError(f"output must be 'figure' or 'png', got {output!r}")
+    if not data_ref:
+        return figs, ["No data provided for plotting"]
+    
+    matplotlib_loc = _LOC_MAP.get(legend_loc, "best")
+    bbox = _BBOX_BY_LOC.get(matplotlib_loc)
+    x_pos_l = x_pos.lower()
+    y_pos_l = y_pos.lower()
+
+    # Parse custom legends
+    custom_label_map, custom_color_map, legend_errors = _parse_custom_legends(custom_legends, use_colorful)
+    skipped_curves.extend(legend_errors)
 
     # Check if axes should be centered at (0,0)
     center_x = x_min < 0 < x_max
@@ -78,333 +623,198 @@ def plot_graphs(data_ref, use_colorful, num_colors, bg_color, legend_loc, custom
         num_points = 5000
     else:
         num_points = 8000  # For very large ranges like -10000 to 10000
+    # Beyond two samples per output pixel column the extra points are only overdrawn;
+    # a line needs at least its two end points however small the figure
+    num_points = max(2, min(num_points, int(figsize[0] * dpi * 2)))
 
-    def plot_single_curve(ax, entry, color, label, x_min, x_max, y_min, y_max, auto_scale_y, 
-                         stop_y_exit, stop_x_exit, center_x, center_y, x_pos, y_pos, 
-                         x_major_int, x_minor_int, y_major_int, y_minor_int, 
-                         x_label, y_label, show_grid, grid_major_x, grid_minor_x, 
-                         grid_major_y, grid_minor_y, invert_y_axis, use_colorful, title_suffix=""):
-        """
-        Helper function to plot a single curve with common logic.
-        """
-        name = entry['name']
-        try:
-            coeffs = np.array(entry['coefficients'], dtype=float)
-        except (ValueError, TypeError) as e:
-            skipped_curves.append(f"Curve {name}: Invalid coefficients ({str(e)})")
-            return False
-        
-        # Check polynomial degree limit
-        degree = len(coeffs) - 1
-        if degree > 10:
-            skipped_curves.append(f"Curve {name}: Degree {degree} exceeds maximum allowed (10). Truncated to degree 10.")
-            coeffs = coeffs[:11]  # Keep only up to degree 10 (11 coefficients)
-
-        # Generate x values
-        p1_full = np.linspace(x_min, x_max, num_points)
-        
-        # Evaluate polynomial with error handling
-        try:
-            y_vals = np.polyval(coeffs, p1_full)
-        except Exception as e:
-            skipped_curves.append(f"Curve {name}: Polynomial evaluation failed ({str(e)})")
-            return False
+    # The x grid is identical for every curve, so build it once
+    p1_full = np.linspace(x_min, x_max, num_points)
 
-        if np.all(np.isnan(y_vals)) or np.all(np.isinf(y_vals)):
-            skipped_curves.append(f"Curve {name}: No valid polynomial output (all NaN/Inf)")
-            return False
+    # (coeffs, y_vals, finite) per entry, so the plotting pass reuses the scaling pass's evaluation
+    evaluated = {}
 
-        # Find valid points (finite values)
-        valid = np.isfinite(y_vals)
-        
-        # Apply x limits (should always be true for linspace, but keep for safety)
-        valid = valid & (p1_full >= x_min) & (p1_full <= x_max)
-        
-        # Apply y limits if not auto-scaling
-        if not auto_scale_y and y_min is not None and y_max is not None:
-            valid = valid & (y_vals >= y_min) & (y_vals <= y_max)
-
-        p_plot = p1_full[valid]
-        y_plot = y_vals[valid]
-
-        # Handle stop_y_exit - only truncate after first exit, not before
-        if stop_y_exit and not auto_scale_y and y_min is not None and y_max is not None and len(p_plot) > 0:
-            # Find first point that exits y-range (but only after entering)
-            in_range = (y_vals >= y_min) & (y_vals <= y_max) & np.isfinite(y_vals)
-            exit_points = np.where(~in_range & np.roll(in_range, 1))[0]
-            if len(exit_points) > 0:
-                first_exit_idx = exit_points[0]
-                # Only truncate from first exit onward if we had some valid points before
-                if np.any(in_range[:first_exit_idx]):
-                    valid[first_exit_idx:] = False
-                    p_plot = p1_full[valid]
-                    y_plot = y_vals[valid]
-                    skipped_curves.append(f"Curve {name}: Truncated at x={p1_full[first_exit_idx]:.2f}, y={y_vals[first_exit_idx]:.2f}")
-
-        # Handle stop_x_exit
-        if stop_x_exit and len(p_plot) > 0:
-            # This should rarely trigger with linspace, but included for completeness
-            x_valid = (p1_full >= x_min) & (p1_full <= x_max)
-            x_exit_idx = np.where(~x_valid)[0]
-            if len(x_exit_idx) > 0:
-                first_exit_idx = x_exit_idx[0]
-                valid[first_exit_idx:] = False
-                p_plot = p1_full[valid]
-                y_plot = y_vals[valid]
-                skipped_curves.append(f"Curve {name}: X-truncated at x={p1_full[first_exit_idx]:.2f}")
-
-        if len(p_plot) < 2:
-            skipped_curves.append(f"Curve {name}: Insufficient valid points ({len(p_plot)})")
-            return False
-
-        # Plot the curve
-        try:
-            ax.plot(p_plot, y_plot, color=color, linewidth=2.5, label=label if use_colorful else None)
-        except Exception as e:
-            skipped_curves.append(f"Curve {name}: Plotting failed ({str(e)})")
-            return False
-
-        # Add label for non-colorful mode
-        if not use_colorful and len(p_plot) > 0:
-            y_range = (y_max - y_min) if not auto_scale_y and y_min is not None and y_max is not None else (max(y_plot) - min(y_plot))
-            x_range = x_max - x_min
-            end_x, end_y = p_plot[-1], y_plot[-1] - 0.05 * y_range if y_range > 0 else y_plot[-1]
-            
-            # Avoid label overlap by adjusting position
-            text = ax.text(end_x, end_y, label, fontsize=8, ha='left', va='center',
-                          bbox=dict(boxstyle="round,pad=0.3", facecolor=bg_color, alpha=0.8))
-            return True
-
-        return True
-
-    if plot_grouping == "All in One":
-        # Single plot - collect all data first for auto-scaling
-        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
-        fig.patch.set_facecolor(bg_color)
-        ax.set_facecolor(bg_color)
-        
-        all_y_vals = []
-        plot_data = []
-        successful_plots = 0
-
-        # First pass: collect data and compute auto-scale if needed
-        for i, entry in enumerate(data_ref):
-            if 'name' not in entry or 'coefficients' not in entry:
-                skipped_curves.append(f"Entry {i}: Missing 'name' or 'coefficients' key")
-                continue
-                
-            name = entry['name']
-            color = custom_color_map.get(name, colors[i % len(colors)]) if use_colorful else 'black'
-            label = custom_label_map.get(name, name)
-            
-            # Temporary plot to get y values for auto-scaling
-            temp_fig, temp_ax = plt.subplots(figsize=(1,1))
-            success = plot_single_curve(temp_ax, entry, color, label, x_min, x_max, 
-                                       y_min, y_max, True, stop_y_exit, stop_x_exit, 
-                                       center_x, center_y, x_pos, y_pos, 
-                                       x_major_int, x_minor_int, y_major_int, y_minor_int,
-                                       x_label, y_label, show_grid, grid_major_x, grid_minor_x,
-                                       grid_major_y, grid_minor_y, invert_y_axis, use_colorful)
-            plt.close(temp_fig)
-            
-            if success and hasattr(temp_ax, 'lines') and temp_ax.lines:
-                # Extract y data from the temporary plot
-                temp_y = temp_ax.lines[0].get_ydata()
-                if len(temp_y) > 0:
-                    all_y_vals.extend(temp_y)
-                    plot_data.append((name, entry, color, label, i))
-                    successful_plots += 1
+    show_minor_grid = grid_minor_x > 0 and grid_minor_y > 0
 
-        # Apply auto-scaling if needed
-        if auto_scale_y and all_y_vals and successful_plots > 0:
-            y_min_new = min(all_y_vals)
-            y_max_new = max(all_y_vals)
-            y_range = y_max_new - y_min_new
-            if y_range > 0:
-                y_min = y_min_new - 0.1 * y_range
-                y_max = y_max_new + 0.1 * y_range
-            else:
-                # Handle constant functions
-                y_min = y_min_new - 1
-                y_max = y_max_new + 1
-            center_y = y_min < 0 < y_max
-
-        # Second pass: actual plotting
-        for name, entry, color, label, i in plot_data:
-            success = plot_single_curve(ax, entry, color, label, x_min, x_max, 
-                                       y_min, y_max, auto_scale_y, stop_y_exit, stop_x_exit, 
-                                       center_x, center_y, x_pos, y_pos, 
-                                       x_major_int, x_minor_int, y_major_int, y_minor_int,
-                                       x_label, y_label, show_grid, grid_major_x, grid_minor_x,
-                                       grid_major_y, grid_minor_y, invert_y_axis, use_colorful)
-            
-            if success and not use_colorful:
-                # Adjust text positions to avoid overlap
-                if hasattr(ax, 'texts') and len(ax.texts) > 1:
-                    adjust_text(ax.texts, ax=ax, only_move={'points': 'y', 'text': 'xy'})
+    # Explicit tick intervals win over grid spacing; resolved once for every axes
+    locator_intervals = (
+        x_major_int if x_major_int > 0 else (grid_major_x if show_grid and grid_major_x > 0 else None),
+        x_minor_int if x_minor_int > 0 else (grid_minor_x if show_grid and grid_minor_x > 0 else None),
+        y_major_int if y_major_int > 0 else (grid_major_y if show_grid and grid_major_y > 0 else None),
+        y_minor_int if y_minor_int > 0 else (grid_minor_y if show_grid and grid_minor_y > 0 else None),
+    )
 
-        # Axis setup
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
-        ax.set_xlim(x_min, x_max)
-        if y_min is not None and y_max is not None:
-            ax.set_ylim(y_min, y_max)
-        if invert_y_axis:
-            ax.invert_yaxis()
-
-        # Center spines at (0,0) if ranges include negative and positive values
-        if center_x and center_y:
-            ax.spines['left'].set_position('zero')
-            ax.spines['bottom'].set_position('zero')
-            ax.spines['right'].set_color('none')
-            ax.spines['top'].set_color('none')
-            ax.xaxis.set_ticks_position('bottom' if x_pos.lower() == 'bottom' else 'top')
-            ax.yaxis.set_ticks_position('left' if y_pos.lower() == 'left' else 'right')
-            ax.xaxis.set_label_position(x_pos.lower())
-            ax.yaxis.set_label_position(y_pos.lower())
-        else:
-            ax.xaxis.set_label_position(x_pos.lower())
-            ax.xaxis.set_ticks_position(x_pos.lower())
-            ax.yaxis.set_label_position(y_pos.lower())
-            ax.yaxis.set_ticks_position(y_pos.lower())
-
-        # Grid setup
-        if show_grid:
-            grid_color = '#D3D3D3' if use_colorful else 'black'
-            ax.grid(True, which='major', color=grid_color, alpha=0.5 if use_colorful else 0.3)
-            if grid_minor_x > 0 and grid_minor_y > 0:
-                ax.grid(True, which='minor', color=grid_color, linestyle='--', alpha=0.5 if use_colorful else 0.2)
-            ax.xaxis.set_major_locator(plt.MultipleLocator(grid_major_x))
-            if grid_minor_x > 0:
-                ax.xaxis.set_minor_locator(plt.MultipleLocator(grid_minor_x))
-            ax.yaxis.set_major_locator(plt.MultipleLocator(grid_major_y))
-            if grid_minor_y > 0:
-                ax.yaxis.set_minor_locator(plt.MultipleLocator(grid_minor_y))
-
-        # Ticks setup
-        if x_major_int > 0:
-            ax.xaxis.set_major_locator(plt.MultipleLocator(x_major_int))
-        if x_minor_int > 0:
-            ax.xaxis.set_minor_locator(plt.MultipleLocator(x_minor_int))
-        if y_major_int > 0:
-            ax.yaxis.set_major_locator(plt.MultipleLocator(y_major_int))
-        if y_minor_int > 0:
-            ax.yaxis.set_minor_locator(plt.MultipleLocator(y_minor_int))
-
-        # Legend
-        bbox = (1.05, 0.5) if 'right' in matplotlib_loc else (-0.05, 0.5) if 'left' in matplotlib_loc else \
-               (0.5, 1.05) if 'upper' in matplotlib_loc else (0.5, -0.05) if 'lower' in matplotlib_loc else None
-        
-        if use_colorful and ax.get_legend_handles_labels()[0]:
-            ax.legend(loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
-        elif not use_colorful and ax.texts:
-            ax.legend(['Custom Labels'], loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
+    # Figures taken from the pool by this call and not yet handed back to it
+    open_figs = []
 
-        ax.set_title(f"{title} ({successful_plots} curves)")
-        figs.append((fig, "All Curves"))
+    def new_figure():
+        """Take a figure from the pool, tracking it until it is released or returned."""
+        fig, ax = _acquire_figure(figsize, dpi)
+        open_figs.append(fig)
+        return fig, ax
+
+    def finish_figure(fig, name):
+        """
+        Add a completed figure to the results.
         
+        In PNG mode it is rendered straight away and returned to the pool, so
+        the next per-curve plot reuses the same Figure instead of building one.
+        """
+        if output == "png":
+            figs.append((_figure_to_png(fig, dpi), name))
+            open_figs.remove(fig)
+            _release_figure(fig)
+        else:
+            figs.append((fig, name))
+
+    # Resolve every curve's color and label up front; both branches cycle the palette
+    names = [entry.get('name') for entry in data_ref]
+    if use_colorful:
+        curve_colors = [custom_color_map.get(name, colors[(color_offset + i) % len(colors)])
+                        for i, name in enumerate(names)]
     else:
-        # One plot per curve
-        for i, entry in enumerate(data_ref):
-            if 'name' not in entry or 'coefficients' not in entry:
-                skipped_curves.append(f"Entry {i}: Missing 'name' or 'coefficients' key")
-                continue
-                
-            name = entry['name']
-            color = custom_color_map.get(name, colors[0]) if use_colorful else 'black'
-            label = custom_label_map.get(name, name)
-            
-            fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        curve_colors = ['black'] * len(names)
+    curve_labels = [custom_label_map.get(name, name) for name in names]
+
+    parallel = None
+    if (output == "png" and plot_grouping != "All in One" and len(data_ref) >= _PARALLEL_MIN_CURVES
+            and (os.cpu_count() or 1) > 1):
+        parallel = _render_curves_parallel(data_ref, call_args)
+    elif len(data_ref) >= _BATCHED_EVAL_MIN_CURVES:
+        # Fill the evaluation cache up front; both passes below then only plot
+        evaluated.update(_evaluate_curves_batched(data_ref, p1_full))
+
+    try:
+        if parallel is not None:
+            figs, worker_skipped = parallel
+            skipped_curves.extend(worker_skipped)
+
+        elif plot_grouping == "All in One":
+            # Single plot - collect all data first for auto-scaling
+            fig, ax = new_figure()
             fig.patch.set_facecolor(bg_color)
             ax.set_facecolor(bg_color)
+        
+            # Running y extremes over the auto-scaled curves
+            y_min_new, y_max_new = np.inf, -np.inf
+            plot_data = []
+            successful_plots = 0
+            legend_handles = []
+            legend_labels = []
+
+            # First pass: collect the plottable entries, evaluating them only when auto-scaling
+            for i, entry in enumerate(data_ref):
+                if 'name' not in entry or 'coefficients' not in entry:
+                    skipped_curves.append(f"Entry {i}: Missing 'name' or 'coefficients' key")
+                    continue
+
+                if auto_scale_y:
+                    # Evaluate without plotting to get y values for auto-scaling
+                    _, y_plot, messages = _compute_curve(entry, p1_full, y_min, y_max, True, stop_y_exit,
+                                                         cache=evaluated)
+                    skipped_curves.extend(messages)
+                    if y_plot is None:
+                        continue
+                    # y_plot only holds finite values, so plain array reductions are safe
+                    y_min_new = min(y_min_new, y_plot.min())
+                    y_max_new = max(y_max_new, y_plot.max())
+                plot_data.append((names[i], entry, curve_colors[i], curve_labels[i], i))
+
+            # Apply auto-scaling if needed
+            if auto_scale_y and plot_data:
+                y_range = y_max_new - y_min_new
+                if y_range > 0:
+                    y_min = y_min_new - 0.1 * y_range
+                    y_max = y_max_new + 0.1 * y_range
+                else:
+                    # Handle constant functions
+                    y_min = y_min_new - 1
+                    y_max = y_max_new + 1
+                center_y = y_min < 0 < y_max
+
+            # Second pass: actual plotting
+            for name, entry, color, label, i in plot_data:
+                line = _plot_single_curve(ax, entry, color, label, p1_full, y_min, y_max, auto_scale_y,
+                                          stop_y_exit, use_colorful, bg_color, rasterize_curves,
+                                          skipped_curves, cache=evaluated)
+                if line:
+                    successful_plots += 1
             
-            # Determine y limits for this curve if auto-scaling
-            curve_y_min, curve_y_max = y_min, y_max
-            if auto_scale_y:
-                temp_fig, temp_ax = plt.subplots(figsize=(1,1))
-                plot_single_curve(temp_ax, entry, color, label, x_min, x_max, 
-                                 y_min, y_max, True, stop_y_exit, stop_x_exit, 
-                                 center_x, center_y, x_pos, y_pos, 
-                                 x_major_int, x_minor_int, y_major_int, y_minor_int,
-                                 x_label, y_label, show_grid, grid_major_x, grid_minor_x,
-                                 grid_major_y, grid_minor_y, invert_y_axis, use_colorful)
-                if hasattr(temp_ax, 'lines') and temp_ax.lines:
-                    temp_y = temp_ax.lines[0].get_ydata()
-                    if len(temp_y) > 0:
-                        curve_y_min = min(temp_y) - 0.1 * (max(temp_y) - min(temp_y))
-                        curve_y_max = max(temp_y) + 0.1 * (max(temp_y) - min(temp_y))
-                plt.close(temp_fig)
-            
-            success = plot_single_curve(ax, entry, color, label, x_min, x_max, 
-                                       curve_y_min, curve_y_max, auto_scale_y, stop_y_exit, stop_x_exit, 
-                                       center_x, center_y, x_pos, y_pos, 
-                                       x_major_int, x_minor_int, y_major_int, y_minor_int,
-                                       x_label, y_label, show_grid, grid_major_x, grid_minor_x,
-                                       grid_major_y, grid_minor_y, invert_y_axis, use_colorful)
-            
-            if not success:
-                plt.close(fig)
-                continue
+                if line and use_colorful:
+                    legend_handles.append(line)
+                    legend_labels.append(label)
 
             # Axis setup
-            ax.set_xlabel(x_label)
-            ax.set_ylabel(y_label)
-            ax.set_xlim(x_min, x_max)
-            if curve_y_min is not None and curve_y_max is not None:
-                ax.set_ylim(curve_y_min, curve_y_max)
-            if invert_y_axis:
-                ax.invert_yaxis()
-
-            # Center spines
-            if center_x and (curve_y_min < 0 < curve_y_max):
-                ax.spines['left'].set_position('zero')
-                ax.spines['bottom'].set_position('zero')
-                ax.spines['right'].set_color('none')
-                ax.spines['top'].set_color('none')
-                ax.xaxis.set_ticks_position('bottom' if x_pos.lower() == 'bottom' else 'top')
-                ax.yaxis.set_ticks_position('left' if y_pos.lower() == 'left' else 'right')
-                ax.xaxis.set_label_position(x_pos.lower())
-                ax.yaxis.set_label_position(y_pos.lower())
-            else:
-                ax.xaxis.set_label_position(x_pos.lower())
-                ax.xaxis.set_ticks_position(x_pos.lower())
-                ax.yaxis.set_label_position(y_pos.lower())
-                ax.yaxis.set_ticks_position(y_pos.lower())
-
-            # Grid
-            if show_grid:
-                grid_color = '#D3D3D3' if use_colorful else 'black'
-                ax.grid(True, which='major', color=grid_color, alpha=0.5 if use_colorful else 0.3)
-                if grid_minor_x > 0 and grid_minor_y > 0:
-                    ax.grid(True, which='minor', color=grid_color, linestyle='--', alpha=0.5 if use_colorful else 0.2)
-                ax.xaxis.set_major_locator(plt.MultipleLocator(grid_major_x))
-                if grid_minor_x > 0:
-                    ax.xaxis.set_minor_locator(plt.MultipleLocator(grid_minor_x))
-                ax.yaxis.set_major_locator(plt.MultipleLocator(grid_major_y))
-                if grid_minor_y > 0:
-                    ax.yaxis.set_minor_locator(plt.MultipleLocator(grid_minor_y))
-
-            # Ticks
-            if x_major_int > 0:
-                ax.xaxis.set_major_locator(plt.MultipleLocator(x_major_int))
-            if x_minor_int > 0:
-                ax.xaxis.set_minor_locator(plt.MultipleLocator(x_minor_int))
-            if y_major_int > 0:
-                ax.yaxis.set_major_locator(plt.MultipleLocator(y_major_int))
-            if y_minor_int > 0:
-                ax.yaxis.set_minor_locator(plt.MultipleLocator(y_minor_int))
+            _configure_axes(ax, x_min, x_max, y_min, y_max, invert_y_axis, center_x and center_y, x_pos_l, y_pos_l,
+                            x_label, y_label, show_grid, show_minor_grid, use_colorful, locator_intervals)
+
+            # Spread the black-and-white labels apart now that the limits are final
+            if not use_colorful and len(ax.texts) > 1:
+                if adjust_labels:
+                    adjust_text(ax.texts, ax=ax, only_move={'points': 'y', 'text': 'xy'})
+                else:
+                    _space_labels_y(ax.texts, ax)
 
             # Legend
-            bbox = (1.05, 0.5) if 'right' in matplotlib_loc else (-0.05, 0.5) if 'left' in matplotlib_loc else \
-                   (0.5, 1.05) if 'upper' in matplotlib_loc else (0.5, -0.05) if 'lower' in matplotlib_loc else None
-            
-            if use_colorful and ax.get_legend_handles_labels()[0]:
-                ax.legend(loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
-            elif len(ax.texts) > 0:
-                ax.legend(['Custom Label'], loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
+            if use_colorful and legend_handles:
+                ax.legend(legend_handles, legend_labels, loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
+            elif not use_colorful and ax.texts:
+                ax.legend(['Custom Labels'], loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
 
-            ax.set_title(f"{title} - {name}")
-            figs.append((fig, name))
+            ax.set_title(f"{title} ({successful_plots} curves)")
+            finish_figure(fig, "All Curves")
+        
+        else:
+            # One plot per curve
+            for i, entry in enumerate(data_ref):
+                if 'name' not in entry or 'coefficients' not in entry:
+                    skipped_curves.append(f"Entry {i}: Missing 'name' or 'coefficients' key")
+                    continue
+                
+                name = names[i]
+                color = curve_colors[i]
+                label = curve_labels[i]
+            
+                fig, ax = new_figure()
+                fig.patch.set_facecolor(bg_color)
+                ax.set_facecolor(bg_color)
+            
+                # Determine y limits for this curve if auto-scaling
+                curve_y_min, curve_y_max = y_min, y_max
+                if auto_scale_y:
+                    _, temp_y, messages = _compute_curve(entry, p1_full, y_min, y_max, True, stop_y_exit,
+                                                         cache=evaluated)
+                    skipped_curves.extend(messages)
+                    if temp_y is not None:
+                        temp_min, temp_max = temp_y.min(), temp_y.max()
+                        curve_y_min = temp_min - 0.1 * (temp_max - temp_min)
+                        curve_y_max = temp_max + 0.1 * (temp_max - temp_min)
+            
+                line = _plot_single_curve(ax, entry, color, label, p1_full, curve_y_min, curve_y_max,
+                                          auto_scale_y, stop_y_exit, use_colorful, bg_color, rasterize_curves,
+                                          skipped_curves, cache=evaluated)
+            
+                if not line:
+                    _release_figure(fig)
+                    continue
+
+                # Axis setup
+                _configure_axes(ax, x_min, x_max, curve_y_min, curve_y_max, invert_y_axis,
+                                center_x and (curve_y_min < 0 < curve_y_max), x_pos_l, y_pos_l,
+                                x_label, y_label, show_grid, show_minor_grid, use_colorful, locator_intervals)
+
+                # Legend
+                if use_colorful:
+                    ax.legend([line], [label], loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
+                elif len(ax.texts) > 0:
+                    ax.legend(['Custom Label'], loc=matplotlib_loc, bbox_to_anchor=bbox, fontsize=8, frameon=True, edgecolor='black')
+
+                ax.set_title(f"{title} - {name}")
+                finish_figure(fig, name)
+    except BaseException:
+        # Hand back the figures this call took, since the caller never receives them
+        for fig in open_figs:
+            _release_figure(fig)
+        raise
 
     if debug:
         print(f"Debug: Processed {len(figs)} plots, skipped {len(skipped_curves)} curves:")